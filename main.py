@@ -1,34 +1,135 @@
 import discord
+import asyncio
 from discord.ext import commands, tasks
 from datetime import datetime, timedelta
 import pytz
 from fredapi import Fred
 import pandas as pd
+import numpy as np
 import os
+import json
+import hashlib
+import re
 from dotenv import load_dotenv
 import aiohttp
 import io
 import time
+import functools
+import bisect
+from concurrent.futures import ThreadPoolExecutor
 
 # Load environment variables
 load_dotenv()
 
+# Read the token once and fail fast, rather than with a confusing error inside bot.run
+DISCORD_TOKEN = os.environ.get('DISCORD_TOKEN')
+if not DISCORD_TOKEN:
+    raise SystemExit("DISCORD_TOKEN is not set. Add it to your .env file.")
+
+class FinvizBot(commands.Bot):
+    """Bot that owns a pooled HTTP session shared by all outbound requests"""
+
+    http_session: aiohttp.ClientSession = None
+
+    async def setup_hook(self):
+        """Create the shared HTTP session and worker pool before connecting to Discord"""
+        # Blocking FRED calls run on this pool so they never stall the event loop
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=FRED_MAX_WORKERS, thread_name_prefix='fred')
+        )
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=8,
+            keepalive_timeout=60,
+            ttl_dns_cache=300
+        )
+        self.http_session = aiohttp.ClientSession(connector=connector)
+
+    async def close(self):
+        """Close the shared HTTP session along with the bot"""
+        if self.http_session is not None:
+            await self.http_session.close()
+        await super().close()
+
 # Set up Discord bot with necessary intents
 intents = discord.Intents.default()
 intents.message_content = True
-bot = commands.Bot(command_prefix=';', intents=intents)
+bot = FinvizBot(command_prefix=';', intents=intents)
 
 # Set up slash commands
 tree = bot.tree
 
 # Initialize APIs with environment variables
-fred = Fred(api_key=os.getenv('FRED_API_KEY'))
+FRED_API_KEY = os.getenv('FRED_API_KEY')
+fred = Fred(api_key=FRED_API_KEY)
+
+# FRED REST endpoint, called directly over the bot's pooled HTTP session
+FRED_API_URL = 'https://api.stlouisfed.org/fred/'
 
 # Store channel IDs where the bot should send updates
 ANNOUNCEMENT_CHANNELS = set()
 
-# Economic events cache
+# On-disk state so channel settings and the last fetched events survive restarts
+DATA_DIR = os.getenv('DATA_DIR', os.path.dirname(os.path.abspath(__file__)))
+CHANNELS_FILE = os.path.join(DATA_DIR, 'channels.json')
+EVENTS_FILE = os.path.join(DATA_DIR, 'events.json')
+TREE_HASH_FILE = os.path.join(DATA_DIR, 'tree_hash.json')
+
+# Optional guild to sync slash commands to; guild commands update instantly, global ones can take an hour
+SYNC_GUILD_ID = os.getenv('SYNC_GUILD_ID')
+
+# Economic events cache, plus views pre-partitioned by impact
 daily_events = []
+daily_events_high = ()
+daily_events_other = ()
+events_version = 0  # Bumped on every refresh to invalidate derived caches
+
+# Events with a real intra-day time, sorted by epoch for notification lookups
+notifiable_events = []
+notifiable_event_epochs = []
+
+# Announce events this many seconds before release
+NOTIFY_LEAD_TIME = 15 * 60
+
+# One-shot notification timers, rebuilt on every refresh, and the sends they start
+notification_handles = []
+notification_tasks = set()
+
+# (series_id, epoch) of events already announced, so a reschedule never repeats one
+announced_events = set()
+
+# Cap concurrent FRED requests so the daily refresh stays within rate limits
+FRED_MAX_WORKERS = 8
+FRED_CONCURRENCY = asyncio.Semaphore(FRED_MAX_WORKERS)
+
+# Chart timeframes supported by free Finviz charts
+VALID_TIMEFRAMES = {'d': 'daily', 'w': 'weekly', 'm': 'monthly'}
+INTRADAY_TIMEFRAMES = frozenset({'3', '5', '15'})
+
+# Browser-like headers for Finviz chart downloads; the Referer is added per chart
+FINVIZ_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0 Safari/537.36",
+    "Cache-Control": "no-cache",
+    "Pragma": "no-cache",
+    "Accept": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8",
+}
+
+# Finviz chart images keyed by (ticker, timeframe); longer timeframes change less often
+CHART_CACHE_MAXSIZE = 256
+CHART_TTL = {'d': 5 * 60, 'w': 30 * 60, 'm': 60 * 60}
+chart_cache = {}
+chart_inflight = {}  # One shared download task per chart, so concurrent misses fetch once
+
+# FRED data updates at most daily, so keep recent responses in memory
+CACHE_MAXSIZE = 512
+SERIES_INFO_TTL = 24 * 60 * 60  # Series metadata rarely changes
+SERIES_TTL = 60 * 60
+INTRADAY_SERIES_TTL = 5 * 60
+INTRADAY_SERIES = frozenset({'VIXCLS', 'DCOILWTICO'})
+
+# Cache entries are (value, expires_at) tuples keyed by request parameters
+series_info_cache = {}
+series_cache = {}
 
 # Important economic indicators and market data to track
 ECONOMIC_INDICATORS = {
@@ -66,6 +167,9 @@ ECONOMIC_INDICATORS = {
     'HOUST': 'Housing Starts'
 }
 
+# Indicators listed as high impact releases
+HIGH_IMPACT = frozenset({'CPIAUCSL', 'PAYEMS', 'GDP', 'FEDFUNDS'})
+
 # Add Fed calendar events (these won't come from FRED API)
 FED_EVENTS = {
     'FOMC': 'Federal Open Market Committee Meeting',
@@ -75,10 +179,143 @@ FED_EVENTS = {
     'SPEECH': 'Fed Chair Speech'
 }
 
+# Value formatters for series that need special display
+FORMATTERS = {
+    'UNRATE': lambda v: f"{v:.2f}%",
+    'FEDFUNDS': lambda v: f"{v:.2f}%",
+    'DGS2': lambda v: f"{v:.2f}%",
+    'DGS10': lambda v: f"{v:.2f}%",
+    'T10Y2Y': lambda v: f"{v:.2f}%",
+    'DCOILWTICO': lambda v: f"${v:.2f}/bbl",  # Oil price
+    'GOLDPMGBD228NLBM': lambda v: f"${v:.2f}/oz",  # Gold price
+    'ICSA': lambda v: f"{v:,.0f}",
+    'VIXCLS': lambda v: f"{v:.2f}",
+}
+
+@functools.lru_cache(maxsize=None)
+def _units_formatter(units: str):
+    """Pick a value formatter from a series' units metadata"""
+    if 'Billions of Dollars' in units:
+        return lambda v: f"${v:,.2f}B"
+    if 'Millions of Dollars' in units:
+        return lambda v: f"${v:,.2f}M"
+    return lambda v: f"{v:,.2f}"
+
+def _load_json(path, default):
+    """Read a JSON state file, returning the default if it is missing or unreadable"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+    except (OSError, ValueError) as e:
+        print(f"Failed to load {path}: {e}")
+        return default
+
+def _save_json(path, data):
+    """Atomically write a JSON state file"""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Failed to save {path}: {e}")
+
+def save_channels():
+    """Persist the announcement channels"""
+    _save_json(CHANNELS_FILE, sorted(ANNOUNCEMENT_CHANNELS))
+
+def load_channels():
+    """Load saved announcement channels, ignoring anything that isn't a list of IDs"""
+    channels = _load_json(CHANNELS_FILE, [])
+    if not isinstance(channels, list) or not all(isinstance(channel_id, int) for channel_id in channels):
+        print(f"Ignoring malformed {CHANNELS_FILE}")
+        return []
+    return channels
+
+# Keys every saved event needs; snapshots from other versions may lack some
+EVENT_KEYS = frozenset({
+    'time', 'epoch', 'date_str', 'time_str', 'utc_time_str', 'name_field',
+    'title', 'series_id', 'impact', 'previous'
+})
+
+def load_events():
+    """Load the saved events snapshot, ignoring it unless every event has the expected shape"""
+    events = _load_json(EVENTS_FILE, [])
+    if not isinstance(events, list) or not all(
+        isinstance(event, dict) and EVENT_KEYS <= event.keys() for event in events
+    ):
+        print(f"Ignoring malformed {EVENTS_FILE}")
+        return []
+    return events
+
+def _cache_get(cache, key):
+    """Return a cached value, or None if it is missing or expired"""
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    value, expires_at = entry
+    if expires_at < time.monotonic():
+        cache.pop(key, None)
+        return None
+    return value
+
+def _cache_set(cache, key, value, ttl, maxsize=CACHE_MAXSIZE):
+    """Store a value with an expiry, evicting the oldest entry when full"""
+    if key not in cache and len(cache) >= maxsize:
+        cache.pop(next(iter(cache)))
+    cache[key] = (value, time.monotonic() + ttl)
+
+async def fred_api(endpoint, **params):
+    """Call a FRED REST endpoint and return the decoded JSON response"""
+    params = {key: value for key, value in params.items() if value is not None}
+    params.update(api_key=FRED_API_KEY, file_type='json')
+    async with FRED_CONCURRENCY:
+        async with bot.http_session.get(
+            FRED_API_URL + endpoint,
+            params=params,
+            timeout=aiohttp.ClientTimeout(total=30)
+        ) as resp:
+            if resp.status == 200:
+                return await resp.json(content_type=None)
+            # Error bodies are usually JSON with a message, but proxies may return HTML or plain text
+            try:
+                data = await resp.json(content_type=None)
+            except ValueError:
+                data = None
+    message = data.get('error_message') if isinstance(data, dict) else None
+    raise ValueError(message or f"HTTP {resp.status}")
+
+async def cached_series_info(series_id):
+    """Get FRED series metadata, served from memory when fresh"""
+    info = _cache_get(series_info_cache, series_id)
+    if info is None:
+        data = await fred_api('series', series_id=series_id)
+        info = pd.Series(data['seriess'][0])
+        _cache_set(series_info_cache, series_id, info, SERIES_INFO_TTL)
+    return info
+
+async def cached_series(series_id, **kw):
+    """Get FRED observations, served from memory when fresh"""
+    key = (series_id, kw.get('observation_start'), kw.get('observation_end'), kw.get('limit'))
+    series = _cache_get(series_cache, key)
+    if series is None:
+        data = await fred_api('series/observations', series_id=series_id, **kw)
+        observations = data['observations']
+        # FRED marks missing values with '.', which becomes NaN
+        series = pd.Series(
+            pd.to_numeric([obs['value'] for obs in observations], errors='coerce'),
+            index=pd.to_datetime([obs['date'] for obs in observations]),
+            dtype=float
+        )
+        ttl = INTRADAY_SERIES_TTL if series_id in INTRADAY_SERIES else SERIES_TTL
+        _cache_set(series_cache, key, series, ttl)
+    return series
+
 async def fetch_economic_events():
     """Fetch upcoming economic releases from FRED"""
-    events = []
-    
     # Get current time in ET (US Eastern Time)
     et_tz = pytz.timezone('US/Eastern')
     now = datetime.now(et_tz)
@@ -97,140 +334,238 @@ async def fetch_economic_events():
     # Use the calendar date only (midnight) to avoid showing incorrect times.
     release_date = next_day.date()
     
+    # Derive display strings and the epoch once, since every event shares the release time
+    event_time = datetime.combine(release_date, datetime.min.time(), tzinfo=pytz.UTC)
+    date_str = event_time.strftime('%a, %b %d')  # e.g., "Mon, Nov 16"
+    if event_time.hour or event_time.minute:
+        time_str = event_time.strftime('%I:%M %p')
+        name_field = f"{date_str} • {time_str}"
+    else:
+        time_str = ''
+        name_field = date_str
+    
+    # Observation window for recent data (last 30 days), formatted once for every series
+    start_date_str = (now - timedelta(days=30)).strftime('%Y-%m-%d')
+    end_date_str = now.strftime('%Y-%m-%d')
+    
+    async def _fetch_one(series_id, description):
+        """Fetch a single indicator and build its event entry"""
+        try:
+            # Get series info and latest value
+            info = await cached_series_info(series_id)
+            
+            # Get recent data (last 30 days)
+            series = await cached_series(
+                series_id,
+                observation_start=start_date_str,
+                observation_end=end_date_str
+            )
+            
+            if series.empty:
+                # If no recent data, get the last value
+                series = await cached_series(series_id, limit=1)
+            
+            # Get the most recent non-null value
+            last_idx = series.last_valid_index()
+            previous_value = series.loc[last_idx] if last_idx is not None else None
+            
+            # Format the value based on series type, falling back to its units
+            fmt = FORMATTERS.get(series_id) or _units_formatter(info.get('units', ''))
+            if previous_value is not None and not pd.isna(previous_value):
+                formatted_value = fmt(previous_value)
+            else:
+                formatted_value = 'N/A'
+            
+            return {
+                'time': release_date.isoformat(),
+                'epoch': int(event_time.timestamp()),
+                'date_str': date_str,
+                'time_str': time_str,
+                'utc_time_str': event_time.strftime("%H:%M UTC"),
+                'name_field': name_field,
+                'title': f"{description}",
+                'series_id': series_id,
+                'impact': 'High' if series_id in HIGH_IMPACT else 'Medium',
+                'previous': formatted_value
+            }
+        except Exception as e:
+            print(f"Error fetching {series_id}: {e}")
+            return None
+    
     try:
-        for series_id, description in ECONOMIC_INDICATORS.items():
-            try:
-                # Get series info and latest value
-                info = fred.get_series_info(series_id)
-                
-                # Get recent data (last 30 days)
-                end_date = now
-                start_date = end_date - timedelta(days=30)
-                series = fred.get_series(
-                    series_id,
-                    observation_start=start_date.strftime('%Y-%m-%d'),
-                    observation_end=end_date.strftime('%Y-%m-%d')
-                )
-                
-                if series.empty:
-                    # If no recent data, get the last value
-                    series = fred.get_series(series_id, limit=1)
-                
-                # Get the most recent non-null value
-                previous_value = None
-                for val in series:
-                    if pd.notna(val):
-                        previous_value = val
-                        break
-                
-                # Format the value based on units and series type
-                if previous_value is not None and not pd.isna(previous_value):
-                    if series_id in ['UNRATE', 'FEDFUNDS', 'DGS2', 'DGS10', 'T10Y2Y']:
-                        formatted_value = f"{previous_value:.2f}%"
-                    elif series_id == 'DCOILWTICO':  # Oil price
-                        formatted_value = f"${previous_value:.2f}/bbl"
-                    elif series_id == 'GOLDPMGBD228NLBM':  # Gold price
-                        formatted_value = f"${previous_value:.2f}/oz"
-                    elif 'Billions of Dollars' in info.get('units', ''):
-                        formatted_value = f"${previous_value:,.2f}B"
-                    elif 'Millions of Dollars' in info.get('units', ''):
-                        formatted_value = f"${previous_value:,.2f}M"
-                    elif series_id == 'ICSA':
-                        formatted_value = f"{previous_value:,.0f}"
-                    elif series_id == 'VIXCLS':
-                        formatted_value = f"{previous_value:.2f}"
-                    else:
-                        formatted_value = f"{previous_value:,.2f}"
-                else:
-                    formatted_value = 'N/A'
-                
-                events.append({
-                    'time': release_date.isoformat(),
-                    'title': f"{description}",
-                    'series_id': series_id,
-                    'impact': 'High' if series_id in ['CPIAUCSL', 'PAYEMS', 'GDP', 'FEDFUNDS'] else 'Medium',
-                    'previous': formatted_value
-                })
-            except Exception as e:
-                print(f"Error fetching {series_id}: {e}")
-                continue
+        # Fetch all indicators concurrently instead of one round-trip at a time
+        results = await asyncio.gather(
+            *[_fetch_one(series_id, description) for series_id, description in ECONOMIC_INDICATORS.items()],
+            return_exceptions=True
+        )
+        events = [result for result in results if isinstance(result, dict)]
         
         return sorted(events, key=lambda x: x['time'])
     except Exception as e:
         print(f"Error fetching economic events: {e}")
         return []
 
-@tasks.loop(minutes=1)
-async def check_events():
-    """Check for upcoming economic events and send notifications"""
-    now = datetime.now(pytz.UTC)
+async def send_event_notification(event):
+    """Announce an upcoming economic release in every announcement channel"""
+    # The embed is identical for every channel, so build it once
+    embed = discord.Embed(
+        title="🔔 Upcoming Economic Release",
+        description=f"**{event['title']}**",
+        color=0x00ff00
+    )
+    embed.add_field(name="Time", value=event['utc_time_str'])
+    embed.add_field(name="Impact", value=event['impact'])
+    embed.add_field(name="Previous Value", value=event['previous'])
+    
+    # Broadcast to all channels concurrently; discord.py handles per-route rate limits
+    channels = [bot.get_channel(channel_id) for channel_id in ANNOUNCEMENT_CHANNELS]
+    results = await asyncio.gather(
+        *(channel.send(embed=embed) for channel in channels if channel),
+        return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"Failed to send notification for {event['series_id']}: {result}")
+
+def _start_event_notification(event):
+    """Timer callback that starts the notification send"""
+    key = (event['series_id'], event['epoch'])
+    if key in announced_events:
+        return
+    announced_events.add(key)
+    task = asyncio.create_task(send_event_notification(event))
+    # Hold a reference so the task isn't garbage collected mid-send
+    notification_tasks.add(task)
+    task.add_done_callback(notification_tasks.discard)
+
+def schedule_notifications():
+    """Schedule a single notification ahead of each upcoming event, replacing any previous schedule"""
+    for handle in notification_handles:
+        handle.cancel()
+    notification_handles.clear()
     
-    for event in daily_events:
-        event_time = datetime.fromisoformat(event['time']).replace(tzinfo=pytz.UTC)
-        # Skip events without a specific intra-day time (midnight placeholder)
-        if event_time.hour == 0 and event_time.minute == 0:
+    loop = asyncio.get_running_loop()
+    now = time.time()
+    # Forget announcements for events that have long passed
+    announced_events.difference_update(
+        [key for key in announced_events if key[1] < now - NOTIFY_LEAD_TIME]
+    )
+    # Events already inside the last minute of the lead window are announced right away
+    start = bisect.bisect_left(notifiable_event_epochs, now + NOTIFY_LEAD_TIME - 60)
+    for event in notifiable_events[start:]:
+        if (event['series_id'], event['epoch']) in announced_events:
             continue
+        delay = max(0, event['epoch'] - NOTIFY_LEAD_TIME - now)
+        notification_handles.append(loop.call_later(delay, _start_event_notification, event))
 
-        time_until_event = event_time - now
-        
-        if timedelta(minutes=14) <= time_until_event <= timedelta(minutes=15):
-            for channel_id in ANNOUNCEMENT_CHANNELS:
-                channel = bot.get_channel(channel_id)
-                if channel:
-                    embed = discord.Embed(
-                        title="🔔 Upcoming Economic Release",
-                        description=f"**{event['title']}**",
-                        color=0x00ff00
-                    )
-                    embed.add_field(name="Time", value=event_time.strftime("%H:%M UTC"))
-                    embed.add_field(name="Impact", value=event['impact'])
-                    embed.add_field(name="Previous Value", value=event['previous'])
-                    await channel.send(embed=embed)
+def set_daily_events(events):
+    """Replace the events cache and its derived views"""
+    global daily_events, daily_events_high, daily_events_other, events_version
+    global notifiable_events, notifiable_event_epochs
+    daily_events = events
+    daily_events_high = tuple(event for event in events if event['impact'] == 'High')
+    daily_events_other = tuple(event for event in events if event['impact'] != 'High')
+    events_version += 1
+    
+    # Events without a specific intra-day time (midnight placeholder) are never announced
+    notifiable_events = sorted((event for event in events if event['time_str']), key=lambda x: x['epoch'])
+    notifiable_event_epochs = [event['epoch'] for event in notifiable_events]
+    schedule_notifications()
 
 @tasks.loop(hours=24)
 async def update_daily_events():
     """Update the cache of daily events"""
-    global daily_events
-    daily_events = await fetch_economic_events()
+    # Drop cached observations so the refresh picks up new releases
+    series_cache.clear()
+    events = await fetch_economic_events()
+    if events:
+        set_daily_events(events)
+        # Keep the last good snapshot on disk so fresh boots can serve ;events instantly
+        _save_json(EVENTS_FILE, events)
+
+def _command_tree_hash(guild):
+    """Hash the slash command schema that a sync would upload"""
+    payload = [cmd.to_dict(tree) for cmd in tree.get_commands(guild=guild)]
+    target = [bot.application_id, guild.id if guild is not None else None, payload]
+    return hashlib.blake2b(json.dumps(target, sort_keys=True).encode()).hexdigest()
+
+async def sync_command_tree():
+    """Sync slash commands, skipping any scope whose schema is unchanged since its last sync"""
+    saved = _load_json(TREE_HASH_FILE, {})
+    if not isinstance(saved, dict):
+        saved = {}
+    
+    # Hash file keys: 'global' or a guild ID
+    targets = {'global': None}
+    if SYNC_GUILD_ID:
+        guild = discord.Object(id=int(SYNC_GUILD_ID))
+        # Move the commands to the guild and clear the global copies, so the guild doesn't list each one twice
+        tree.copy_global_to(guild=guild)
+        tree.clear_commands(guild=None)
+        targets[str(guild.id)] = guild
+    # Guilds synced before but no longer configured get their commands removed
+    stale = [key for key in saved if key not in targets]
+    for key in stale:
+        targets[key] = discord.Object(id=int(key))
+    
+    for key, target in targets.items():
+        tree_hash = _command_tree_hash(target)
+        if saved.get(key) == tree_hash:
+            print(f"Slash commands unchanged since last sync ({key})")
+            continue
+        synced = await tree.sync(guild=target)
+        if key in stale:
+            saved.pop(key)
+        else:
+            saved[key] = tree_hash
+        _save_json(TREE_HASH_FILE, saved)
+        print(f"Synced {len(synced)} slash command(s) ({key})")
+        for cmd in synced:
+            print(f"  - /{cmd.name}: {cmd.description}")
 
 @bot.event
 async def on_ready():
     """Bot initialization"""
     print(f'{bot.user} has connected to Discord!')
     
-    # Sync slash commands
     try:
-        synced = await bot.tree.sync()
-        print(f"Synced {len(synced)} slash command(s)")
-        for cmd in synced:
-            print(f"  - /{cmd.name}: {cmd.description}")
+        await sync_command_tree()
     except Exception as e:
         print(f"Failed to sync slash commands: {e}")
     
-    update_daily_events.start()
-    check_events.start()
+    # Restore saved state before the first refresh completes
+    try:
+        ANNOUNCEMENT_CHANNELS.update(load_channels())
+        if not daily_events:
+            set_daily_events(load_events())
+    except Exception as e:
+        print(f"Failed to restore saved state: {e}")
+    
+    # on_ready fires again after reconnects, so only start the refresh loop once
+    if not update_daily_events.is_running():
+        update_daily_events.start()
+
+# Prefix commands handled by discord.py; anything else starting with ';' is a chart request
+_KNOWN_CMDS = frozenset({'help', 'setchannel', 'removechannel', 'events', 'getdata', 'search', 'correlation'})
+_CHART_RE = re.compile(r';\s*(\S+)\s+(\S+)\s*$')
 
 @bot.event
 async def on_message(message):
     if message.author == bot.user:
         return
 
-    if message.content.startswith(';'):
-        # Process help commands first
-        if message.content.startswith(';help'):
-            await bot.process_commands(message)
-            return
-            
-        # Process other bot commands
-        if message.content.startswith((';setchannel', ';removechannel', ';events', 
-                                     ';getdata', ';search', ';correlation')):
+    content = message.content
+    if content.startswith(';'):
+        # Dispatch on the first token instead of testing each command prefix
+        tokens = content[1:].split(maxsplit=1)
+        if tokens and tokens[0] in _KNOWN_CMDS:
             await bot.process_commands(message)
             return
             
         # Handle chart commands
-        parts = message.content[1:].split()
-        if len(parts) == 2:
-            ticker, timeframe = parts
+        match = _CHART_RE.match(content)
+        if match:
+            ticker, timeframe = match.groups()
             await send_chart(message.channel, ticker, timeframe)
             return
         else:
@@ -240,54 +575,68 @@ async def on_message(message):
     # Process other commands
     await bot.process_commands(message)
 
+async def _download_chart(chart_url: str, upper_ticker: str, p: str) -> bytes:
+    """Download a Finviz chart image, raising on any non-200 response"""
+    headers = {**FINVIZ_HEADERS, "Referer": f"https://finviz.com/quote.ashx?t={upper_ticker}&p={p}"}
+    async with bot.http_session.get(chart_url, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as resp:
+        if resp.status != 200:
+            # Caller falls back to embedding the URL with a cache-busting param
+            raise RuntimeError(f"HTTP {resp.status}")
+        return await resp.read()
+
+async def _download_and_cache_chart(chart_url: str, upper_ticker: str, p: str) -> bytes:
+    """Download a chart and store it in the chart cache"""
+    image_bytes = await _download_chart(chart_url, upper_ticker, p)
+    _cache_set(chart_cache, (upper_ticker, p), image_bytes, CHART_TTL[p], maxsize=CHART_CACHE_MAXSIZE)
+    return image_bytes
+
+async def _get_chart_bytes(chart_url: str, upper_ticker: str, p: str) -> bytes:
+    """Get chart bytes from the cache, joining any download already in flight on a miss"""
+    key = (upper_ticker, p)
+    image_bytes = _cache_get(chart_cache, key)
+    if image_bytes is not None:
+        return image_bytes
+
+    task = chart_inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_download_and_cache_chart(chart_url, upper_ticker, p))
+        chart_inflight[key] = task
+        # Drop the entry once the download settles, whether it succeeded or failed
+        task.add_done_callback(lambda done: chart_inflight.pop(key, None) if chart_inflight.get(key) is done else None)
+    # Shield so one cancelled caller doesn't cancel the download for everyone else
+    return await asyncio.shield(task)
+
 async def send_chart(channel, ticker: str, timeframe: str):
-    """Fetch and send a fresh Finviz chart as an attachment to bypass Discord caching."""
+    """Fetch and send a recent Finviz chart as an attachment to bypass Discord caching."""
     timeframe = timeframe.lower()
-    valid_timeframes = {
-        'd': 'daily', 'w': 'weekly', 'm': 'monthly'
-    }
 
-    if timeframe in ['3', '5', '15']:
+    if timeframe in INTRADAY_TIMEFRAMES:
         await channel.send("Intraday charts are only available for FINVIZ*Elite users.")
         return
 
-    if timeframe not in valid_timeframes:
+    if timeframe not in VALID_TIMEFRAMES:
         await channel.send("Invalid timeframe. Use 'd' for daily, 'w' for weekly, or 'm' for monthly.")
         return
 
-    # Build Finviz chart URL
-    p_map = {'daily': 'd', 'weekly': 'w', 'monthly': 'm'}
-    p = p_map[valid_timeframes[timeframe]]
+    # Build Finviz chart URL; the timeframe letter is also Finviz's period parameter
+    p = timeframe
     upper_ticker = ticker.upper()
     chart_url = f"https://finviz.com/chart.ashx?t={upper_ticker}&ty=c&ta=1&p={p}&s=l"
 
     # Try downloading the image and uploading it as an attachment (prevents Discord CDN caching)
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0 Safari/537.36",
-                "Referer": f"https://finviz.com/quote.ashx?t={upper_ticker}&p={p}",
-                "Cache-Control": "no-cache",
-                "Pragma": "no-cache",
-                "Accept": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8",
-            }
-            async with session.get(chart_url, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as resp:
-                if resp.status == 200:
-                    image_bytes = await resp.read()
-                    file_name = f"{upper_ticker}_{p}_{int(time.time())}.png"
-                    file = discord.File(io.BytesIO(image_bytes), filename=file_name)
-
-                    embed = discord.Embed(title=f"{upper_ticker} {valid_timeframes[timeframe]} Chart", color=0x00ff00)
-                    embed.set_image(url=f"attachment://{file_name}")
-                    await channel.send(embed=embed, file=file)
-                    return
-                else:
-                    # Fall back to embedding the URL with a cache-busting param
-                    raise RuntimeError(f"HTTP {resp.status}")
+        image_bytes = await _get_chart_bytes(chart_url, upper_ticker, p)
+
+        file_name = f"{upper_ticker}_{p}_{int(time.time())}.png"
+        file = discord.File(io.BytesIO(image_bytes), filename=file_name)
+
+        embed = discord.Embed(title=f"{upper_ticker} {VALID_TIMEFRAMES[timeframe]} Chart", color=0x00ff00)
+        embed.set_image(url=f"attachment://{file_name}")
+        await channel.send(embed=embed, file=file)
     except Exception:
         # Fallback: Use the direct URL with a timestamp to bust Discord cache
         cache_bust_url = f"{chart_url}&rand={int(time.time())}"
-        embed = discord.Embed(title=f"{upper_ticker} {valid_timeframes[timeframe]} Chart", color=0x00ff00)
+        embed = discord.Embed(title=f"{upper_ticker} {VALID_TIMEFRAMES[timeframe]} Chart", color=0x00ff00)
         embed.set_image(url=cache_bust_url)
         await channel.send(embed=embed)
 
@@ -303,6 +652,7 @@ async def set_channel(ctx):
         ;setchannel
     """
     ANNOUNCEMENT_CHANNELS.add(ctx.channel.id)
+    save_channels()
     await ctx.send(f"✅ This channel will now receive economic event notifications!")
 
 @bot.command(name='removechannel')
@@ -317,32 +667,15 @@ async def remove_channel(ctx):
         ;removechannel
     """
     ANNOUNCEMENT_CHANNELS.discard(ctx.channel.id)
+    save_channels()
     await ctx.send(f"❌ This channel will no longer receive economic event notifications!")
 
-@bot.command(name='events')
-async def list_events(ctx):
-    """Lists upcoming economic releases and events
+@functools.lru_cache(maxsize=1)
+def _build_event_embeds(version):
+    """Build the high impact and other events embeds for an events snapshot
     
-    Shows both high-impact and other economic events with their scheduled times and previous values.
-    Events are grouped by date and impact level for easy reading.
-    
-    Usage:
-        ;events
+    Cached on the snapshot version, so the embeds are only rebuilt after a refresh.
     """
-    if not daily_events:
-        await ctx.send("No economic events scheduled.")
-        return
-
-    # Group events by date and impact
-    high_impact_events = []
-    other_events = []
-    
-    for event in daily_events:
-        if event['impact'] == 'High':
-            high_impact_events.append(event)
-        else:
-            other_events.append(event)
-
     # Create embed for high impact events
     high_impact_embed = discord.Embed(
         title="🔴 High Impact Economic Releases",
@@ -350,17 +683,9 @@ async def list_events(ctx):
     )
 
     # Format high impact events
-    for event in high_impact_events:
-        event_date = datetime.fromisoformat(event['time'])
-        date_str = event_date.strftime('%a, %b %d')  # e.g., "Mon, Nov 16"
-        if event_date.hour or event_date.minute:
-            time_str = event_date.strftime('%I:%M %p')
-            name_field = f"{date_str} • {time_str}"
-        else:
-            name_field = date_str
-        
+    for event in daily_events_high:
         high_impact_embed.add_field(
-            name=name_field,
+            name=event['name_field'],
             value=f"**{event['title']}**\n└ Previous: {event['previous']}",
             inline=False
         )
@@ -375,14 +700,9 @@ async def list_events(ctx):
     current_date = None
     current_text = ""
     
-    for event in other_events:
-        event_date = datetime.fromisoformat(event['time'])
-        date_str = event_date.strftime('%a, %b %d')
-        if event_date.hour or event_date.minute:
-            time_str = event_date.strftime('%I:%M %p')
-            time_component = f"`{time_str}` "
-        else:
-            time_component = ""
+    for event in daily_events_other:
+        date_str = event['date_str']
+        time_component = f"`{event['time_str']}` " if event['time_str'] else ""
         
         if date_str != current_date:
             if current_text:
@@ -395,6 +715,24 @@ async def list_events(ctx):
     if current_text:
         other_embed.add_field(name=current_date, value=current_text, inline=False)
 
+    return high_impact_embed, other_embed
+
+@bot.command(name='events')
+async def list_events(ctx):
+    """Lists upcoming economic releases and events
+    
+    Shows both high-impact and other economic events with their scheduled times and previous values.
+    Events are grouped by date and impact level for easy reading.
+    
+    Usage:
+        ;events
+    """
+    if not daily_events:
+        await ctx.send("No economic events scheduled.")
+        return
+
+    high_impact_embed, other_embed = _build_event_embeds(events_version)
+
     # Send embeds
     await ctx.send(embed=high_impact_embed)
     await ctx.send(embed=other_embed)
@@ -415,24 +753,68 @@ async def get_current_data(ctx, series_id: str):
     """
     try:
         # Get series info and data
-        info = fred.get_series_info(series_id)
+        info = await cached_series_info(series_id)
         # Retrieve full series to ensure we get the latest observation (fred returns ascending order)
-        series = fred.get_series(series_id)
-        # Drop any trailing NaNs just in case
-        series = series.dropna()
+        series = await cached_series(series_id)
+        # Skip any trailing NaNs just in case
+        last_idx = series.last_valid_index()
+        if last_idx is None:
+            raise ValueError(f"No observations available for {series_id}")
         
         embed = discord.Embed(
             title=f"📊 {info['title']}",
             color=0x00ff00
         )
-        embed.add_field(name="Latest Value", value=f"{series.iloc[-1]:,.2f}")
-        embed.add_field(name="Last Updated", value=series.index[-1].strftime('%Y-%m-%d'))
+        embed.add_field(name="Latest Value", value=f"{series.loc[last_idx]:,.2f}")
+        embed.add_field(name="Last Updated", value=last_idx.strftime('%Y-%m-%d'))
         embed.add_field(name="Units", value=info.get('units', 'N/A'))
         
         await ctx.send(embed=embed)
     except Exception as e:
         await ctx.send(f"Error fetching data: {str(e)}")
 
+# Frequency suffixes that add noise to search results
+_FREQ_STRIP = re.compile(r', (?:Ending Friday|Close)')
+
+def _format_index_units(units):
+    """Shorten index units, keeping the base year if there is one"""
+    if '=' in units:
+        base_year = units.split('=')[1].strip()
+        return f"Index (Base: {base_year})"
+    return "Index"
+
+# Units shorthands, checked in order against a series' units
+_UNITS_FORMATS = (
+    ('Index', _format_index_units),
+    ('Dollars per', lambda units: f"${units.replace('Dollars per', 'per')}"),
+    ('Billions of Dollars', lambda units: "$B"),
+    ('Millions of Dollars', lambda units: "$M"),
+)
+
+def _format_search_row(idx, row):
+    """Format a FRED search result as an embed field name and value"""
+    # Format frequency to be more readable
+    freq = _FREQ_STRIP.sub('', row['frequency'])
+    
+    # Format title to be more concise
+    title = row['title']
+    if len(title) > 50:
+        title = title[:47] + "..."
+    
+    # Format units more cleanly
+    units = row['units']
+    for substr, formatter in _UNITS_FORMATS:
+        if substr in units:
+            units = formatter(units)
+            break
+    
+    value_text = (
+        f"**Series ID:** `{idx}`\n"
+        f"**Frequency:** {freq}\n"
+        f"**Units:** {units}"
+    )
+    return f"📊 {title}", value_text
+
 # Add a new command to search for series
 @bot.command(name='search')
 async def search_series(ctx, *search_terms):
@@ -451,7 +833,7 @@ async def search_series(ctx, *search_terms):
     """
     try:
         search_text = ' '.join(search_terms)
-        results = fred.search(search_text, limit=5)
+        results = await asyncio.to_thread(fred.search, search_text, limit=5)
         
         embed = discord.Embed(
             title=f"🔍 Search Results for '{search_text}'",
@@ -459,46 +841,25 @@ async def search_series(ctx, *search_terms):
         )
         
         for idx, row in results.iterrows():
-            # Format frequency to be more readable
-            freq = row['frequency'].replace(', Ending Friday', '')
-            freq = freq.replace(', Close', '')
-            
-            # Format title to be more concise
-            title = row['title']
-            if len(title) > 50:
-                title = title[:47] + "..."
-            
-            # Format units more cleanly
-            units = row['units']
-            if 'Index' in units:
-                if '=' in units:  # If it has a base year
-                    base_year = units.split('=')[1].strip()
-                    units = f"Index (Base: {base_year})"
-                else:
-                    units = "Index"
-            elif 'Dollars per' in units:
-                units = f"${units.replace('Dollars per', 'per')}"
-            elif 'Billions of Dollars' in units:
-                units = "$B"
-            elif 'Millions of Dollars' in units:
-                units = "$M"
-            
-            value_text = (
-                f"**Series ID:** `{idx}`\n"
-                f"**Frequency:** {freq}\n"
-                f"**Units:** {units}"
-            )
-            
-            embed.add_field(
-                name=f"📊 {title}",
-                value=value_text,
-                inline=False
-            )
+            name, value_text = _format_search_row(idx, row)
+            embed.add_field(name=name, value=value_text, inline=False)
         
         await ctx.send(embed=embed)
     except Exception as e:
         await ctx.send(f"Error searching: {str(e)}")
 
+def _pearson_correlation(data1, data2):
+    """Pearson correlation of two series over their shared, non-null dates"""
+    df = pd.concat([data1.rename('a'), data2.rename('b')], axis=1).dropna()
+    if len(df) < 2:
+        return float('nan')
+    a = df['a'].to_numpy(dtype=float)
+    b = df['b'].to_numpy(dtype=float)
+    am = a - a.mean()
+    bm = b - b.mean()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return float((am @ bm) / np.sqrt((am @ am) * (bm @ bm)))
+
 # Add a command to get correlation between two series
 @bot.command(name='correlation')
 async def get_correlation(ctx, series1: str, series2: str, days: int = 90):
@@ -519,14 +880,14 @@ async def get_correlation(ctx, series1: str, series2: str, days: int = 90):
     """
     try:
         # Get data for both series
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
+        # A date string (rather than a datetime) keeps the cache key stable within the day
+        start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
         
-        data1 = fred.get_series(series1, observation_start=start_date)
-        data2 = fred.get_series(series2, observation_start=start_date)
+        data1 = await cached_series(series1, observation_start=start_date)
+        data2 = await cached_series(series2, observation_start=start_date)
         
         # Calculate correlation
-        correlation = data1.corr(data2)
+        correlation = await asyncio.to_thread(_pearson_correlation, data1, data2)
         
         embed = discord.Embed(
             title=f"📊 Correlation Analysis ({days} days)",
@@ -546,6 +907,7 @@ async def get_correlation(ctx, series1: str, series2: str, days: int = 90):
 async def slash_set_channel(interaction: discord.Interaction):
     """Set current channel for economic event announcements (Admin only)"""
     ANNOUNCEMENT_CHANNELS.add(interaction.channel.id)
+    save_channels()
     await interaction.response.send_message("✅ This channel will now receive economic event notifications!")
 
 @tree.command(name="removechannel", description="Remove current channel from economic event announcements")
@@ -553,6 +915,7 @@ async def slash_set_channel(interaction: discord.Interaction):
 async def slash_remove_channel(interaction: discord.Interaction):
     """Remove current channel from economic event announcements (Admin only)"""
     ANNOUNCEMENT_CHANNELS.discard(interaction.channel.id)
+    save_channels()
     await interaction.response.send_message("❌ This channel will no longer receive economic event notifications!")
 
 @tree.command(name="events", description="Lists upcoming economic releases and events")
@@ -565,104 +928,50 @@ async def slash_list_events(interaction: discord.Interaction):
         await interaction.edit_original_response(content="No economic events scheduled.")
         return
 
-    # Group events by date and impact
-    high_impact_events = []
-    other_events = []
-    
-    for event in daily_events:
-        if event['impact'] == 'High':
-            high_impact_events.append(event)
-        else:
-            other_events.append(event)
-
-    # Create embed for high impact events
-    high_impact_embed = discord.Embed(
-        title="🔴 High Impact Economic Releases",
-        color=0xFF0000
-    )
-
-    # Format high impact events
-    for event in high_impact_events:
-        event_date = datetime.fromisoformat(event['time'])
-        date_str = event_date.strftime('%a, %b %d')  # e.g., "Mon, Nov 16"
-        if event_date.hour or event_date.minute:
-            time_str = event_date.strftime('%I:%M %p')
-            name_field = f"{date_str} • {time_str}"
-        else:
-            name_field = date_str
-        
-        high_impact_embed.add_field(
-            name=name_field,
-            value=f"**{event['title']}**\n└ Previous: {event['previous']}",
-            inline=False
-        )
-
-    # Create embed for other events
-    other_embed = discord.Embed(
-        title="🟡 Other Economic Releases",
-        color=0xFFD700
-    )
-
-    # Format other events more compactly
-    current_date = None
-    current_text = ""
-    
-    for event in other_events:
-        event_date = datetime.fromisoformat(event['time'])
-        date_str = event_date.strftime('%a, %b %d')
-        if event_date.hour or event_date.minute:
-            time_str = event_date.strftime('%I:%M %p')
-            time_component = f"`{time_str}` "
-        else:
-            time_component = ""
-        
-        if date_str != current_date:
-            if current_text:
-                other_embed.add_field(name=current_date, value=current_text, inline=False)
-                current_text = ""
-            current_date = date_str
-            
-        current_text += f"{time_component}**{event['title']}** ({event['previous']})\n"
-    
-    if current_text:
-        other_embed.add_field(name=current_date, value=current_text, inline=False)
+    high_impact_embed, other_embed = _build_event_embeds(events_version)
 
     # Send embeds - edit original response with first embed, then followup for second
     await interaction.edit_original_response(content="📅 Economic Events:", embed=high_impact_embed)
     # For multiple embeds, we need to send followups
-    if other_events:
+    if daily_events_other:
         await interaction.followup.send(embed=other_embed)
 
 @tree.command(name="getdata", description="Get current value for an economic indicator")
 @discord.app_commands.describe(series_id="The series ID to look up (e.g., VIXCLS, CPIAUCSL)")
 async def slash_get_current_data(interaction: discord.Interaction, series_id: str):
     """Get current value for an economic indicator"""
+    # Defer so a slow FRED response doesn't miss the interaction deadline
+    await interaction.response.defer()
     try:
         # Get series info and data
-        info = fred.get_series_info(series_id)
+        info = await cached_series_info(series_id)
         # Retrieve full series to ensure we get the latest observation (fred returns ascending order)
-        series = fred.get_series(series_id)
-        # Drop any trailing NaNs just in case
-        series = series.dropna()
+        series = await cached_series(series_id)
+        # Skip any trailing NaNs just in case
+        last_idx = series.last_valid_index()
+        if last_idx is None:
+            raise ValueError(f"No observations available for {series_id}")
         
         embed = discord.Embed(
             title=f"📊 {info['title']}",
             color=0x00ff00
         )
-        embed.add_field(name="Latest Value", value=f"{series.iloc[-1]:,.2f}")
-        embed.add_field(name="Last Updated", value=series.index[-1].strftime('%Y-%m-%d'))
+        embed.add_field(name="Latest Value", value=f"{series.loc[last_idx]:,.2f}")
+        embed.add_field(name="Last Updated", value=last_idx.strftime('%Y-%m-%d'))
         embed.add_field(name="Units", value=info.get('units', 'N/A'))
         
-        await interaction.response.send_message(embed=embed)
+        await interaction.followup.send(embed=embed)
     except Exception as e:
-        await interaction.response.send_message(f"Error fetching data: {str(e)}")
+        await interaction.followup.send(f"Error fetching data: {str(e)}")
 
 @tree.command(name="search", description="Search for economic data series by keywords")
 @discord.app_commands.describe(keywords="Keywords to search for (e.g., 'oil', 'treasury yield')")
 async def slash_search_series(interaction: discord.Interaction, keywords: str):
     """Search for economic data series by keywords"""
+    # Defer so a slow FRED search doesn't miss the interaction deadline
+    await interaction.response.defer()
     try:
-        results = fred.search(keywords, limit=5)
+        results = await asyncio.to_thread(fred.search, keywords, limit=5)
         
         embed = discord.Embed(
             title=f"🔍 Search Results for '{keywords}'",
@@ -670,45 +979,12 @@ async def slash_search_series(interaction: discord.Interaction, keywords: str):
         )
         
         for idx, row in results.iterrows():
-            # Format frequency to be more readable
-            freq = row['frequency'].replace(', Ending Friday', '')
-            freq = freq.replace(', Close', '')
-            
-            # Format title to be more concise
-            title = row['title']
-            if len(title) > 50:
-                title = title[:47] + "..."
-            
-            # Format units more cleanly
-            units = row['units']
-            if 'Index' in units:
-                if '=' in units:  # If it has a base year
-                    base_year = units.split('=')[1].strip()
-                    units = f"Index (Base: {base_year})"
-                else:
-                    units = "Index"
-            elif 'Dollars per' in units:
-                units = f"${units.replace('Dollars per', 'per')}"
-            elif 'Billions of Dollars' in units:
-                units = "$B"
-            elif 'Millions of Dollars' in units:
-                units = "$M"
-            
-            value_text = (
-                f"**Series ID:** `{idx}`\n"
-                f"**Frequency:** {freq}\n"
-                f"**Units:** {units}"
-            )
-            
-            embed.add_field(
-                name=f"📊 {title}",
-                value=value_text,
-                inline=False
-            )
+            name, value_text = _format_search_row(idx, row)
+            embed.add_field(name=name, value=value_text, inline=False)
         
-        await interaction.response.send_message(embed=embed)
+        await interaction.followup.send(embed=embed)
     except Exception as e:
-        await interaction.response.send_message(f"Error searching: {str(e)}")
+        await interaction.followup.send(f"Error searching: {str(e)}")
 
 @tree.command(name="correlation", description="Calculate correlation between two economic indicators")
 @discord.app_commands.describe(
@@ -720,14 +996,14 @@ async def slash_get_correlation(interaction: discord.Interaction, series1: str,
     """Calculate correlation between two economic indicators"""
     try:
         # Get data for both series
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
+        # A date string (rather than a datetime) keeps the cache key stable within the day
+        start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
         
-        data1 = fred.get_series(series1, observation_start=start_date)
-        data2 = fred.get_series(series2, observation_start=start_date)
+        data1 = await cached_series(series1, observation_start=start_date)
+        data2 = await cached_series(series2, observation_start=start_date)
         
         # Calculate correlation
-        correlation = data1.corr(data2)
+        correlation = await asyncio.to_thread(_pearson_correlation, data1, data2)
         
         embed = discord.Embed(
             title=f"📊 Correlation Analysis ({days} days)",
@@ -752,59 +1028,71 @@ async def slash_get_correlation(interaction: discord.Interaction, series1: str,
 ])
 async def slash_chart(interaction: discord.Interaction, ticker: str, timeframe: str):
     """Get a stock chart from Finviz"""
-    # Send immediate acknowledgment to prevent timeout
-    await interaction.response.send_message("📈 Generating chart...")
+    # Send immediate acknowledgment to prevent timeout; the chart is sent once either way
+    try:
+        await interaction.response.send_message("📈 Generating chart...")
+    except discord.HTTPException as e:
+        print(f"Chart acknowledgment failed: {e}")
 
     # Send the chart directly to the channel (same as prefix command)
     await send_chart(interaction.channel, ticker, timeframe)
 
+class StaticEmbed(discord.Embed):
+    """Embed that is never modified once sent, so its payload dict is built only once"""
+
+    def to_dict(self):
+        try:
+            return self._payload
+        except AttributeError:
+            self._payload = super().to_dict()
+            return self._payload
+
+# The help content is static, so build its embed once at import
+HELP_EMBED = StaticEmbed(
+    title="📊 Finviz Bot Commands",
+    description="Economic data and stock chart bot with both slash and prefix commands",
+    color=0x00ff00
+)
+
+HELP_EMBED.add_field(
+    name="🔄 **Economic Events**",
+    value="**/events** - List upcoming economic releases",
+    inline=False
+)
+
+HELP_EMBED.add_field(
+    name="📈 **Data & Analysis**",
+    value="""\
+**/getdata <series_id>** - Get current economic indicator value
+**/search <keywords>** - Search for economic data series
+**/correlation <series1> <series2> [days]** - Calculate correlation between indicators""",
+    inline=False
+)
+
+HELP_EMBED.add_field(
+    name="📊 **Charts**",
+    value="**/chart <ticker> <timeframe>** - Get stock chart (Daily/Weekly/Monthly)",
+    inline=False
+)
+
+HELP_EMBED.add_field(
+    name="⚙️ **Admin Commands**",
+    value="""\
+**/setchannel** - Enable economic event notifications in this channel
+**/removechannel** - Disable economic event notifications""",
+    inline=False
+)
+
+HELP_EMBED.set_footer(text="Economic data from FRED • Charts from Finviz • Admin commands require permissions")
+
 @tree.command(name="help", description="Show available commands and usage information")
 async def slash_help(interaction: discord.Interaction):
     """Show available commands and usage information"""
-    embed = discord.Embed(
-        title="📊 Finviz Bot Commands",
-        description="Economic data and stock chart bot with both slash and prefix commands",
-        color=0x00ff00
-    )
-    
-    embed.add_field(
-        name="🔄 **Economic Events**",
-        value="**/events** - List upcoming economic releases",
-        inline=False
-    )
-    
-    embed.add_field(
-        name="📈 **Data & Analysis**",
-        value=(
-            "**/getdata <series_id>** - Get current economic indicator value\n"
-            "**/search <keywords>** - Search for economic data series\n"
-            "**/correlation <series1> <series2> [days]** - Calculate correlation between indicators"
-        ),
-        inline=False
-    )
-    
-    embed.add_field(
-        name="📊 **Charts**",
-        value="**/chart <ticker> <timeframe>** - Get stock chart (Daily/Weekly/Monthly)",
-        inline=False
-    )
-    
-    embed.add_field(
-        name="⚙️ **Admin Commands**",
-        value=(
-            "**/setchannel** - Enable economic event notifications in this channel\n"
-            "**/removechannel** - Disable economic event notifications"
-        ),
-        inline=False
-    )
-    
-    embed.set_footer(text="Economic data from FRED • Charts from Finviz • Admin commands require permissions")
-    
     try:
-        await interaction.response.send_message(embed=embed)
+        await interaction.response.send_message(embed=HELP_EMBED)
     except Exception as e:
         print(f"Help command failed: {e}")
         # Fallback: send directly to channel
-        await interaction.channel.send(embed=embed)
+        await interaction.channel.send(embed=HELP_EMBED)
 
-bot.run(os.getenv('DISCORD_TOKEN'))
\ No newline at end of file
+bot.run(DISCORD_TOKEN)
\ No newline at end of file